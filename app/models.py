@@ -5,7 +5,8 @@ from pydantic import BaseModel, Field
 
 
 class NormalizedCsv(BaseModel):
-    sha256: str
+    digest: str
+    digest_algo: str = Field(default="blake2b-256")
     encoding: str = Field(default="utf-8-sig")
     content_b64: str
 
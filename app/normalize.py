@@ -11,225 +11,673 @@ Responsibilities (v1):
 
 from __future__ import annotations
 
-import base64
+import codecs
 import hashlib
 import csv
 import io
+from collections import OrderedDict
 from typing import Any, Dict
 
-from charset_normalizer import from_bytes
+# charset-normalizer drags in sizeable lookup tables at import time, and
+# the ASCII/UTF-8 fast path means most workers never need it at all. Import
+# it on first real use to keep cold start light.
+_from_bytes = None
 
 
-def _sha256_hex(data: bytes) -> str:
-    return hashlib.sha256(data).hexdigest()
+def _get_from_bytes():
+    global _from_bytes
+    if _from_bytes is None:
+        from charset_normalizer import from_bytes
+        _from_bytes = from_bytes
+    return _from_bytes
 
 
-def normalize_encoding_to_utf8_bom(raw: bytes) -> tuple[bytes, Dict[str, Any]]:
+# NumPy is an optional accelerator (the "speed" extra): its comparison
+# kernels are AVX2-vectorized and beat bytes.count once several counts are
+# taken over the same multi-MB buffer. The stdlib path is always correct.
+# Also imported lazily — it is a heavyweight module for a cold start.
+_np = None
+_np_checked = False
+
+
+def _get_np():
+    global _np, _np_checked
+    if not _np_checked:
+        _np_checked = True
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:
+            _np = None
+    return _np
+
+
+# pybase64 (also in the "speed" extra) wraps libbase64's SIMD codec
+# kernels; base64 is a pure lane-repack and vectorizes 4-10x faster than
+# the stdlib's scalar loop. Both produce identical output.
+try:
+    from pybase64 import b64encode as _b64encode
+except ImportError:
+    from base64 import b64encode as _b64encode
+
+
+_FILE_DIGEST_MIN = 1_000_000  # below this, a single C call beats any chunking
+
+# The digest is a content fingerprint for pipeline dedup/verification, not a
+# commitment against adversarial cross-ecosystem collisions. BLAKE2b is ~2x
+# faster than SHA-256 in hashlib on 64-bit platforms and still cryptographic.
+DIGEST_ALGO = "blake2b-256"
+
+
+def _new_digest():
+    return hashlib.blake2b(digest_size=32)
+
+
+def _digest_hex(data: bytes) -> str:
+    """
+    Content-fingerprint hex digest of a whole buffer.
+
+    Large buffers go through ``hashlib.file_digest`` (3.11+), whose read
+    loop runs at C level with optimal chunking and releases the GIL during
+    updates; on 3.10 we emulate it with 128 KB reads. Small buffers take
+    the one-shot call, which has the least overhead.
+    """
+    if len(data) > _FILE_DIGEST_MIN:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(io.BytesIO(data), _new_digest).hexdigest()
+        h = _new_digest()
+        f = io.BytesIO(data)
+        while chunk := f.read(1 << 17):
+            h.update(chunk)
+        return h.hexdigest()
+    h = _new_digest()
+    h.update(data)
+    return h.hexdigest()
+
+
+def _b64_str(data: bytes) -> str:
+    """
+    Base64-encode ``data`` to an ASCII str in one C-level call (pybase64's
+    SIMD kernels when installed). A chunked variant existed briefly to
+    interleave hashing, but once hashing moved to file_digest the chunk
+    loop bought nothing: the parts all had to be joined anyway, so the
+    full encoding was alive regardless.
+    """
+    return _b64encode(data).decode("ascii")
+
+
+_BOM = b"\xef\xbb\xbf"  # UTF-8 BOM; prepended to output instead of encoding utf-8-sig
+
+# Detection is run on a bounded prefix: charset-normalizer's scoring loop is
+# pure Python and its cost grows with payload size, so probing the whole
+# upload dominates latency on multi-MB files. 64 KB is plenty for a verdict.
+DETECT_SAMPLE_SIZE = 65536
+
+
+_DELIM_CANDIDATES = (b",", b";", b"\t", b"|")
+
+
+def _detect_delimiter(sample: bytes) -> tuple[str, bool]:
+    """
+    Pick the delimiter with the highest per-line median count, breaking
+    ties by count stability (lowest variance) and then candidate order.
+
+    Deterministic replacement for ``csv.Sniffer``: count each candidate per
+    line with ``bytes.count`` (C-level). Median ranks before variance on
+    purpose — a stray character that shows up exactly once per line (say a
+    ``|`` inside a note column) has perfect stability but a low median,
+    and must not outrank the real delimiter whose count jitters because
+    of quoted cells. Sniffer's regex heuristics are slow and have
+    pathological cases on realistic CSVs.
+
+    Returns ``(delimiter, detected)``; falls back to ``(",", False)`` when no
+    candidate appears at least once per line.
+    """
+    lines = sample.split(b"\n")
+    if len(lines) > 1:
+        # The last line may be truncated by the sample window; drop it.
+        lines = lines[:-1]
+    lines = [ln for ln in lines if ln]
+    if not lines:
+        return ",", False
+
+    best = None
+    for rank, delim in enumerate(_DELIM_CANDIDATES):
+        counts = sorted(ln.count(delim) for ln in lines)
+        median = counts[len(counts) // 2]
+        if median < 1:
+            continue
+        mean = sum(counts) / len(counts)
+        variance = sum((c - mean) ** 2 for c in counts) / len(counts)
+        score = (median, -variance, -rank)
+        if best is None or score > best[0]:
+            best = (score, delim)
+
+    if best is None:
+        return ",", False
+    return best[1].decode("ascii"), True
+
+
+_DECODE_CHUNK = 1 << 20  # 1 MB slices keep the decode working set near cache size
+
+
+def _decode_chunked(raw: bytes, encoding: str, errors: str = "strict") -> str:
+    """
+    Decode ``raw`` to str, feeding large inputs through an incremental
+    decoder in 1 MB slices.
+
+    A monolithic bytes.decode walks the whole payload while building a str
+    up to 4x wider, evicting everything else from cache on multi-MB
+    inputs; slicing keeps each step's working set resident. Small inputs
+    take the one-shot call.
+    """
+    if len(raw) <= _DECODE_CHUNK:
+        return raw.decode(encoding, errors=errors)
+    decoder = codecs.getincrementaldecoder(encoding)(errors=errors)
+    parts = [
+        decoder.decode(raw[start:start + _DECODE_CHUNK])
+        for start in range(0, len(raw), _DECODE_CHUNK)
+    ]
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts)
+
+
+def _count_newlines(data: bytes) -> tuple[int, int, int]:
+    """
+    Count CRLF pairs, CR bytes, and LF bytes in ``data``.
+
+    With NumPy installed the three counts come from vectorized comparisons
+    over a single uint8 view of the buffer (one pass each at memory
+    bandwidth); otherwise bytes.count does the same work via memchr loops.
+    """
+    np = _get_np() if len(data) >= DETECT_SAMPLE_SIZE else None
+    if np is not None:
+        arr = np.frombuffer(data, dtype=np.uint8)
+        cr = arr == 0x0D
+        lf = arr == 0x0A
+        crlf = int((cr[:-1] & lf[1:]).sum()) if len(data) > 1 else 0
+        return crlf, int(cr.sum()), int(lf.sum())
+    crlf = data.count(b"\r\n")
+    return crlf, data.count(b"\r"), data.count(b"\n")
+
+
+def _serialize_row(row: list[str]) -> str:
+    """
+    Render one output row as a comma-joined line.
+
+    csv.writer calls the file's write() for every cell and delimiter; for
+    the typical row with no quotes, commas, or newlines inside cells, a
+    plain str.join is equivalent output at a fraction of the dispatch cost.
+    Rows with a cell that needs quoting fall back to csv.writer.
+    """
+    for cell in row:
+        if '"' in cell or "," in cell or "\n" in cell:
+            out = io.StringIO(newline="")
+            csv.writer(out, delimiter=",", lineterminator="\n").writerow(row)
+            return out.getvalue()
+    return ",".join(row) + "\n"
+
+
+def _build_report(
+    detected, decode_used, decode_fallback, nl_before, nl_after,
+    detected_delim, sniffed, delim_changed,
+    width_expected, width_short_rows, width_long_rows,
+    total_rows, total_cols_max,
+) -> Dict[str, Any]:
+    """Assemble the normalizations section of the report."""
+    return {
+        "encoding": {
+            "detected": detected,
+            "decode_used": decode_used,
+            "decode_fallback": decode_fallback,
+            "output": "utf-8-bom",
+            "notes": "Output is UTF-8 with BOM (utf-8-sig) for deterministic downstream handling.",
+        },
+        "newlines": {
+            "policy": "lf",
+            "before": nl_before,
+            "after": nl_after,
+            "changed": (nl_before["crlf"] > 0) or (nl_before["cr"] > 0),
+        },
+        "delimiter": {
+            "detected": detected_delim,
+            "output": ",",
+            "sniffed": sniffed,
+            "changed": delim_changed,
+            "notes": "Delimiter normalized to comma.",
+        },
+        "row_width": {
+            "expected_columns": width_expected,
+            "short_rows_padded": width_short_rows,
+            "long_rows_errors": width_long_rows,
+            "total_rows": total_rows,
+            "max_columns_seen": total_cols_max,
+            "policy": {
+                "short_rows": "pad",
+                "long_rows": "error",
+                "output_columns": "expected_columns",
+            },
+        },
+    }
+
+
+def _fast_path(raw: bytes):
+    """
+    Recognize input that is already fully normalized and return it with a
+    trivial report, or None to fall through to the general pipeline.
+
+    Most pipeline CSVs are pure-ASCII, LF-terminated, comma-delimited, and
+    rectangular; for those the whole pipeline collapses to prepending the
+    BOM. Every check here is exact, not sampled — a few C-level scans plus
+    one per-line comma count with early exit — so the fast path can never
+    change output, only skip work.
+    """
+    if not (raw and raw.isascii() and raw.endswith(b"\n")):
+        return None
+    if b"\r" in raw or b'"' in raw:
+        return None
+    # The scorer must agree the delimiter is comma; uniform comma counts
+    # alone would wrongly pass e.g. a semicolon-delimited file.
+    delim, sniffed = _detect_delimiter(raw[:DETECT_SAMPLE_SIZE])
+    if delim != ",":
+        return None
+
+    lines = raw.split(b"\n")
+    lines.pop()  # empty tail after the final newline
+    width = lines[0].count(b",") + 1 if lines[0] else 0
+    for line in lines:
+        # Blank lines count as zero cells, as csv.reader would parse them.
+        if (line.count(b",") + 1 if line else 0) != width:
+            return None  # not rectangular; general path pads and reports
+
+    nl = {"crlf": 0, "cr": 0, "lf": len(lines)}
+    report = _build_report(
+        "ascii", "ascii", False, nl, nl,
+        ",", sniffed, False,
+        width, 0, 0, len(lines), width,
+    )
+    return _BOM + raw, report, [], []
+
+
+def normalize_encoding_to_utf8_bom(raw: bytes, cp_hint: str | None = None) -> tuple[bytes, Dict[str, Any]]:
     """
     Normalize input bytes to UTF-8 with BOM (utf-8-sig).
 
     Rules:
-    - Detect encoding best-effort via charset-normalizer.
+    - Detect encoding best-effort via charset-normalizer on a bounded sample.
+    - Callers that already know the codepage (same tenant/pipeline) can pass
+      ``cp_hint`` to skip detection entirely; a hint that fails to decode is
+      ignored and detection proceeds as usual.
     - If detection is uncertain, still attempt decode using best guess.
     - If decode fails, fall back to UTF-8 with replacement characters and report it.
     - Always output utf-8-sig bytes.
     """
+    if cp_hint is None:
+        fast = _fast_path(raw)
+        if fast is not None:
+            return fast
+
     warnings: list[dict] = []
     errors: list[dict] = []
 
     detected = None
     confidence = None
+    text = None  # kept from a successful probe decode so we never decode twice
 
-    match = from_bytes(raw).best()
-    if match is not None:
-        detected = match.encoding
-        # charset-normalizer's match internals vary by version; avoid relying on fingerprint shape
-        confidence = None
+    if cp_hint is not None:
+        try:
+            text = _decode_chunked(raw, cp_hint)
+            detected = cp_hint
+        except (LookupError, UnicodeDecodeError):
+            pass
+
+    if detected is None:
+        # Fast path: most uploads are already ASCII or valid UTF-8, and a
+        # plain decode attempt is orders of magnitude cheaper than running
+        # the detector. Only fall through to charset-normalizer on failure.
+        if raw.isascii():
+            detected = "ascii"
+            text = raw.decode("ascii")
+        else:
+            try:
+                text = _decode_chunked(raw, "utf-8")
+                detected = "utf-8"
+            except UnicodeDecodeError:
+                pass
+
+    detection_sampled = False
+
+    if detected is None:
+        from_bytes = _get_from_bytes()
+        match = from_bytes(raw[:DETECT_SAMPLE_SIZE], steps=5, chunk_size=512, explain=False).best()
+        if match is None and len(raw) > DETECT_SAMPLE_SIZE:
+            # Low confidence on the sample; pay for a full-buffer pass.
+            match = from_bytes(raw).best()
+        elif match is not None and len(raw) > DETECT_SAMPLE_SIZE:
+            # Verdict covers only the prefix; remember that in case the
+            # full payload turns out not to decode with it.
+            detection_sampled = True
+        if match is not None:
+            detected = match.encoding
+            # charset-normalizer's match internals vary by version; avoid relying on fingerprint shape
+            confidence = None
 
     # Decode using detected encoding if available; otherwise try utf-8 first.
     decode_used = detected or "utf-8"
     # If input is UTF-8 and begins with a BOM, decode with utf-8-sig so we don't double-BOM on output.
     if raw.startswith(b"\xef\xbb\xbf") and (decode_used.lower().replace("-", "_") in ("utf_8", "utf8")):
-        decode_used = "utf-8-sig"   
+        decode_used = "utf-8-sig"
+        if text is not None and text.startswith("\ufeff"):
+            # The probe decoded with plain utf-8; dropping the BOM char is
+            # exactly what utf-8-sig would have done, no second decode.
+            text = text[1:]
 
     decode_fallback = False
 
-    try:
-        text = raw.decode(decode_used)
-    except Exception:
-        # Try utf-8 as a fallback
+    if text is None:
         try:
-            text = raw.decode("utf-8")
-            decode_used = "utf-8"
-            decode_fallback = True
+            text = _decode_chunked(raw, decode_used)
         except Exception:
-            # Last resort: decode with replacement so pipeline can continue deterministically
-            text = raw.decode(decode_used, errors="replace")
-            decode_fallback = True
+            # A sample-derived verdict can be wrong about bytes beyond the
+            # window (e.g. an ASCII prefix hiding a latin-1 tail). Failing
+            # to decode the full payload IS the low-confidence signal, so
+            # re-detect over the whole buffer before resorting to lossy
+            # fallbacks.
+            if detection_sampled:
+                match = _get_from_bytes()(raw).best()
+                if match is not None and match.encoding != decode_used:
+                    try:
+                        text = _decode_chunked(raw, match.encoding)
+                        detected = decode_used = match.encoding
+                    except Exception:
+                        pass
+            if text is None:
+                # Try utf-8 as a fallback
+                try:
+                    text = _decode_chunked(raw, "utf-8")
+                    decode_used = "utf-8"
+                    decode_fallback = True
+                except Exception:
+                    # Last resort: decode with replacement so pipeline can continue deterministically
+                    text = _decode_chunked(raw, decode_used, errors="replace")
+                    decode_fallback = True
+
+    # --- Newline normalization: CRLF/CR -> LF (on bytes) ---
+    # Re-encode once and do the counting/replacement on UTF-8 bytes:
+    # bytes.count/replace are C-level single-byte-lane loops, far cheaper
+    # than the equivalent passes over a UCS-4 str on large payloads.
+    utf8 = text.encode("utf-8")
+    del text  # decoded lazily below, only once the csv passes need str
+
+    crlf, cr_total, lf = _count_newlines(utf8)
 
-    # --- Newline normalization: CRLF/CR -> LF ---
     nl_before = {
-        "crlf": text.count("\r\n"),
-        "cr": text.count("\r") - text.count("\r\n"),
-        "lf": text.count("\n"),
+        "crlf": crlf,
+        "cr": cr_total - crlf,
+        "lf": lf,
     }
 
-    # Normalize to LF
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    if cr_total:
+        # Normalize to LF
+        utf8 = utf8.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
 
+    # After normalization CRLF/CR are gone by construction; every CRLF kept
+    # its LF and every bare CR became one, so no re-count pass is needed.
     nl_after = {
-        "crlf": text.count("\r\n"),
-        "cr": text.count("\r"),
-        "lf": text.count("\n"),
+        "crlf": 0,
+        "cr": 0,
+        "lf": lf + (cr_total - crlf),
     }
 
     # --- Delimiter detection + normalization to comma ---
-    sample = text[:4096]
-    detected_delim = ","
-    sniffed = False
+    detected_delim, sniffed = _detect_delimiter(utf8[:DETECT_SAMPLE_SIZE])
 
-    try:
-        dialect = csv.Sniffer().sniff(sample, delimiters=[",", ";", "\t", "|"])
-        detected_delim = dialect.delimiter
-        sniffed = True
-    except Exception:
-        detected_delim = ","  # default
+    text = utf8.decode("utf-8")
 
     delim_changed = detected_delim != ","
 
-    if delim_changed:
-        # Re-serialize using comma delimiter
-        inp = io.StringIO(text, newline="")
-        outp = io.StringIO(newline="")
-
-        reader = csv.reader(inp, delimiter=",")
-        writer = csv.writer(outp, delimiter=",", lineterminator="\n")
-
-        for row in reader:
-            writer.writerow(row)
-
-        text = outp.getvalue()
-
     # --- Row width enforcement (rectangularize) ---
+    # Delimiter normalization happens in the same pass: the reader below
+    # parses with the detected delimiter and every row is re-emitted
+    # comma-delimited, so a non-comma file needs no separate rewrite
+    # round-trip (one parse and one output allocation instead of two).
     width_expected = None
     width_short_rows = 0
     width_long_rows = 0
     total_rows = 0
     total_cols_max = 0
 
+    if not delim_changed and '"' not in text:
+        # Fast path: comma-delimited and no quote characters anywhere, so a
+        # line's comma count is exactly its width and padding is plain
+        # string work. This keeps the csv module (a Python-level parser)
+        # out of the overwhelmingly common case. Any quote in the text
+        # means commas or newlines may be embedded in cells, so we take
+        # the general parser path below instead.
+        lines = text.split("\n")
+        if lines and lines[-1] == "":
+            lines.pop()  # trailing newline produces an empty tail entry
+
+        out_lines: list[str] = []
+        for i, line in enumerate(lines):
+            # A blank line is zero cells — matching what csv.reader yields
+            # for it on the general path — not one empty cell.
+            width = line.count(",") + 1 if line else 0
+            total_rows += 1
+            total_cols_max = max(total_cols_max, width)
+
+            if width_expected is None:
+                width_expected = width
+
+            if width < width_expected:
+                width_short_rows += 1
+                warnings.append({
+                    "row": i + 1,
+                    "column": None,
+                    "issue": "row_too_short",
+                    "value": str(width),
+                    "action": f"padded_to_{width_expected}",
+                })
+                # width_expected cells need width_expected - 1 commas; a
+                # blank line (zero cells) starts from none at all.
+                line = line + "," * (width_expected - max(width, 1))
+            elif width > width_expected:
+                width_long_rows += 1
+                errors.append({
+                    "row": i + 1,
+                    "column": None,
+                    "issue": "row_too_long",
+                    "value": str(width),
+                    "action": f"expected_{width_expected}",
+                })
+
+            out_lines.append(line)
+
+        if width_short_rows == 0 and (not utf8 or utf8.endswith(b"\n")):
+            # Nothing was padded and the trailing newline is already there:
+            # the normalized body is byte-identical to the buffer we hold,
+            # so skip the join and the O(N) re-encode entirely.
+            out_bytes = utf8
+        else:
+            out_bytes = ("\n".join(out_lines) + "\n" if out_lines else "").encode("utf-8")
+        if out_bytes.startswith(_BOM):
+            out_bytes = out_bytes[3:]
+        normalized = _BOM + out_bytes
+
+        report = _build_report(
+            detected, decode_used, decode_fallback, nl_before, nl_after,
+            detected_delim, sniffed, delim_changed,
+            width_expected, width_short_rows, width_long_rows,
+            total_rows, total_cols_max,
+        )
+        return normalized, report, warnings, errors
+
     inp = io.StringIO(text, newline="")
-    outp = io.StringIO(newline="")
 
     reader = csv.reader(inp, delimiter=detected_delim)
-    writer = csv.writer(outp, delimiter=",", lineterminator="\n")
 
-    rows = list(reader)
-    if rows:
-        width_expected = len(rows[0])
+    # Output rows accumulate as strings and are joined once at the end;
+    # str.join preallocates the result in a single pass.
+    out_parts: list[str] = []
+
+    # Stream reader row by row: the first row alone fixes the expected
+    # width, so there is no need to materialize a list of all rows
+    # (original text + list-of-lists + output buffer alive at once).
+    first = next(reader, None)
+    if first is not None:
+        width_expected = len(first)
+        total_rows = 1
+        total_cols_max = len(first)
+        out_parts.append(_serialize_row(first))
+
+        for i, row in enumerate(reader, start=2):
+            total_rows += 1
+            total_cols_max = max(total_cols_max, len(row))
+
+            if len(row) < width_expected:
+                width_short_rows += 1
+                orig_len = len(row)
+
+                # pad
+                row = row + [""] * (width_expected - orig_len)
+
+                # record warning (use original length)
+                warnings.append({
+                    "row": i,
+                    "column": None,
+                    "issue": "row_too_short",
+                    "value": str(orig_len),
+                    "action": f"padded_to_{width_expected}",
+                })
+
+            elif len(row) > width_expected:
+                width_long_rows += 1
+                errors.append({
+                    "row": i,
+                    "column": None,
+                    "issue": "row_too_long",
+                    "value": str(len(row)),
+                    "action": f"expected_{width_expected}",
+                })
+
+            out_parts.append(_serialize_row(row))
+
+    out_bytes = "".join(out_parts).encode("utf-8")
+    if out_bytes.startswith(_BOM):
+        out_bytes = out_bytes[3:]
+    normalized = _BOM + out_bytes
+
+    report = _build_report(
+        detected, decode_used, decode_fallback, nl_before, nl_after,
+        detected_delim, sniffed, delim_changed,
+        width_expected, width_short_rows, width_long_rows,
+        total_rows, total_cols_max,
+    )
+
+    return normalized, report, warnings, errors
+
+
 
-    for i, row in enumerate(rows):
-        total_rows += 1
-        total_cols_max = max(total_cols_max, len(row))
+# Normalization is deterministic by contract (the report says so), which
+# makes it memoizable: automation pipelines routinely re-upload identical
+# payloads. Results are kept per process in an LRU keyed on a short BLAKE2b
+# fingerprint of the raw input, bounded by total normalized bytes held.
+# Multi-worker deployments get one independent cache per worker, which is
+# fine — a miss just recomputes the same deterministic answer.
+_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_cache: OrderedDict[bytes, tuple[bytes, str, Dict[str, Any]]] = OrderedDict()
+_cache_bytes = 0
 
-        if width_expected is None:
-            width_expected = len(row)
 
-        if len(row) < width_expected:
-            width_short_rows += 1
-            orig_len = len(row)
+def _cache_key(raw: bytes, cp_hint: str | None) -> bytes:
+    h = hashlib.blake2b(raw, digest_size=16)
+    if cp_hint is not None:
+        h.update(cp_hint.encode("utf-8", "replace"))
+    return h.digest()
 
-            # pad
-            row = row + [""] * (width_expected - orig_len)
 
-            # record warning (use original length)
-            warnings.append({
-                "row": i + 1,
-                "column": None,
-                "issue": "row_too_short",
-                "value": str(orig_len),
-                "action": f"padded_to_{width_expected}",
-            })
+# Rough live size of one warning/error dict (five keys plus short strings).
+# Malformed input can attach one warning per row, so the report — not the
+# normalized bytes — dominates the footprint and must count toward the bound.
+_CACHE_ITEM_COST = 400
 
 
-        elif len(row) > width_expected:
-            width_long_rows += 1
-            errors.append({
-                "row": i + 1,
-                "column": None,
-                "issue": "row_too_long",
-                "value": str(len(row)),
-                "action": f"expected_{width_expected}",
-            })
+def _cache_entry_size(result: tuple[bytes, str, Dict[str, Any]]) -> int:
+    report = result[2]
+    items = len(report["warnings"]) + len(report["errors"])
+    return len(result[0]) + _CACHE_ITEM_COST * items
 
-        writer.writerow(row)
 
-    text = outp.getvalue()
+def _cache_store(key: bytes, result: tuple[bytes, str, Dict[str, Any]]) -> None:
+    global _cache_bytes
+    size = _cache_entry_size(result)
+    if size > _CACHE_MAX_BYTES:
+        return
+    _cache[key] = result
+    _cache_bytes += size
+    while _cache_bytes > _CACHE_MAX_BYTES:
+        _, evicted = _cache.popitem(last=False)
+        _cache_bytes -= _cache_entry_size(evicted)
 
-    normalized = text.encode("utf-8-sig")
+
+def normalize_csv_payload(
+    raw: bytes,
+    cp_hint: str | None = None,
+    cache_key: bytes | None = None,
+) -> tuple[bytes, str, Dict[str, Any]]:
+    """
+    Run the full pipeline and return ``(normalized_bytes, digest, report)``.
+
+    This is the transport-agnostic core: callers that serve the CSV bytes
+    directly (the raw HTTP path) use it as-is, without paying for base64.
+    Results are memoized on a fingerprint of the input, so duplicate
+    uploads skip the pipeline entirely. Streaming callers that already
+    folded the fingerprint over the upload chunks as they arrived can pass
+    it as ``cache_key`` to skip the extra hashing pass here; it must cover
+    the same input (and cp_hint, if any) that ``_cache_key`` would.
+    """
+    key = cache_key if cache_key is not None else _cache_key(raw, cp_hint)
+    hit = _cache.get(key)
+    if hit is not None:
+        _cache.move_to_end(key)
+        return hit
+
+    normalized_bytes, enc_report, warnings, errors = normalize_encoding_to_utf8_bom(raw, cp_hint=cp_hint)
 
     report = {
-        "encoding": {
-            "detected": detected,
-            "decode_used": decode_used,
-            "decode_fallback": decode_fallback,
-            "output": "utf-8-bom",
-            "notes": "Output is UTF-8 with BOM (utf-8-sig) for deterministic downstream handling.",
-        },
-        "newlines": {
-            "policy": "lf",
-            "before": nl_before,
-            "after": nl_after,
-            "changed": (nl_before["crlf"] > 0) or (nl_before["cr"] > 0),
-        },
-        "delimiter": {
-            "detected": detected_delim,
-            "output": ",",
-            "sniffed": sniffed,
-            "changed": delim_changed,
-            "notes": "Delimiter normalized to comma.",
-        },
-        "row_width": {
-            "expected_columns": width_expected,
-            "short_rows_padded": width_short_rows,
-            "long_rows_errors": width_long_rows,
-            "total_rows": total_rows,
-            "max_columns_seen": total_cols_max,
-            "policy": {
-                "short_rows": "pad",
-                "long_rows": "error",
-                "output_columns": "expected_columns",
-            },
+        "summary": {
+            "rows": None,
+            "columns": None,
+            "warnings": len(warnings),
+            "errors": len(errors),
+            "deterministic": True,
         },
+        "normalizations": enc_report,
+        "warnings": warnings,
+        "errors": errors,
     }
-
-    return normalized, report, warnings, errors
+    result = (normalized_bytes, _digest_hex(normalized_bytes), report)
+    _cache_store(key, result)
+    return result
 
 
-
-def normalize_csv_bytes(raw: bytes) -> Dict[str, Any]:
+def normalize_csv_bytes(
+    raw: bytes,
+    cp_hint: str | None = None,
+    cache_key: bytes | None = None,
+) -> Dict[str, Any]:
     """
     v1: only encoding normalization + report.
-    Returns a dict matching the API's response envelope.
+    Returns a dict matching the API's JSON response envelope.
     """
-    normalized_bytes, enc_report, warnings, errors = normalize_encoding_to_utf8_bom(raw)
+    normalized_bytes, digest, report = normalize_csv_payload(raw, cp_hint=cp_hint, cache_key=cache_key)
 
-    b64 = base64.b64encode(normalized_bytes).decode("ascii")
     return {
         "normalized_csv": {
-            "sha256": _sha256_hex(normalized_bytes),
+            "digest": digest,
+            "digest_algo": DIGEST_ALGO,
             "encoding": "utf-8-sig",
-            "content_b64": b64,
-        },
-        "report": {
-            "summary": {
-                "rows": None,
-                "columns": None,
-                "warnings": len(warnings),
-                "errors": len(errors),
-                "deterministic": True,
-            },
-            "normalizations": enc_report,
-            "warnings": warnings,
-            "errors": errors,
+            "content_b64": _b64_str(normalized_bytes),
         },
+        "report": report,
     }
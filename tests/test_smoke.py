@@ -1,4 +1,5 @@
 import base64
+import json
 
 from fastapi.testclient import TestClient
 from app.main import app
@@ -15,7 +16,7 @@ def test_normalize_encoding_to_utf8_bom():
     raw = "name,city\nPaul,Montréal\n".encode("latin-1")
 
     files = {"file": ("test.csv", raw, "text/csv")}
-    r = client.post("/normalize", files=files)
+    r = client.post("/normalize?format=json", files=files)
     assert r.status_code == 200
 
     data = r.json()
@@ -28,3 +29,93 @@ def test_normalize_encoding_to_utf8_bom():
     # Should decode cleanly as utf-8-sig
     out_text = out_bytes.decode("utf-8-sig")
     assert "Montréal" in out_text
+
+def test_normalize_raw_response_is_default():
+    raw = b"name,city\nAda,London\n"
+
+    files = {"file": ("test.csv", raw, "text/csv")}
+    r = client.post("/normalize", files=files)
+    assert r.status_code == 200
+
+    assert r.headers["content-type"].startswith("text/csv")
+    assert r.content == b"\xef\xbb\xbf" + raw
+    assert r.headers["x-digest-algo"] == "blake2b-256"
+
+    report = json.loads(r.headers["x-normalization-report"])
+    assert report["summary"]["errors"] == 0
+    assert report["normalizations"]["delimiter"]["output"] == ","
+
+def test_normalize_semicolon_delimiter():
+    raw = b"a;b\n1;2\n"
+
+    files = {"file": ("test.csv", raw, "text/csv")}
+    r = client.post("/normalize", files=files)
+    assert r.status_code == 200
+    assert r.content == b"\xef\xbb\xbfa,b\n1,2\n"
+
+    report = json.loads(r.headers["x-normalization-report"])
+    assert report["normalizations"]["delimiter"]["detected"] == ";"
+    assert report["normalizations"]["delimiter"]["changed"] is True
+
+def test_normalize_detects_encoding_beyond_sample_window():
+    # Pure-ASCII prefix larger than the 64 KB detection sample, with the
+    # only accented byte in the tail: detection must re-run on the full
+    # buffer instead of degrading to replacement characters.
+    raw = b"Paul,London\n" * 8000 + "Paul,Montréal\n".encode("latin-1")
+
+    files = {"file": ("test.csv", raw, "text/csv")}
+    r = client.post("/normalize?format=json", files=files)
+    assert r.status_code == 200
+
+    data = r.json()
+    out_text = base64.b64decode(data["normalized_csv"]["content_b64"]).decode("utf-8-sig")
+    assert "Montréal" in out_text
+    assert "�" not in out_text
+    assert data["report"]["normalizations"]["encoding"]["decode_fallback"] is False
+
+def test_normalize_quoted_commas_with_stray_pipe():
+    # A quoted comma makes the per-line comma count jitter, while the "|"
+    # inside the note column appears exactly once per line; the scorer
+    # must still pick comma (median outranks variance).
+    raw = b'a,"x,y",c|note\nb,z,d|note\n'
+
+    files = {"file": ("test.csv", raw, "text/csv")}
+    r = client.post("/normalize", files=files)
+    assert r.status_code == 200
+    assert r.content == b"\xef\xbb\xbf" + raw
+
+    report = json.loads(r.headers["x-normalization-report"])
+    assert report["normalizations"]["delimiter"]["detected"] == ","
+
+def test_normalize_blank_line_reported_as_zero_cells():
+    # The quote-free fast path and the csv.reader path must agree that a
+    # blank line has zero cells, in the report and in the padded output.
+    raw = b"a,b\n\n1,2\n"
+
+    files = {"file": ("test.csv", raw, "text/csv")}
+    r = client.post("/normalize?format=json", files=files)
+    assert r.status_code == 200
+
+    data = r.json()
+    out_bytes = base64.b64decode(data["normalized_csv"]["content_b64"])
+    assert out_bytes.decode("utf-8-sig") == "a,b\n,\n1,2\n"
+
+    warning = data["report"]["warnings"][0]
+    assert warning["issue"] == "row_too_short"
+    assert warning["value"] == "0"
+
+def test_normalize_pads_short_rows():
+    raw = b"a,b,c\n1,2\n4,5,6\n"
+
+    files = {"file": ("test.csv", raw, "text/csv")}
+    r = client.post("/normalize?format=json", files=files)
+    assert r.status_code == 200
+
+    data = r.json()
+    out_bytes = base64.b64decode(data["normalized_csv"]["content_b64"])
+    assert out_bytes.decode("utf-8-sig") == "a,b,c\n1,2,\n4,5,6\n"
+
+    report = data["report"]
+    assert report["summary"]["warnings"] == 1
+    assert report["normalizations"]["row_width"]["short_rows_padded"] == 1
+    assert report["warnings"][0]["issue"] == "row_too_short"